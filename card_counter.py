@@ -5,6 +5,7 @@
 from __future__ import annotations
 
 import math
+from functools import lru_cache
 
 HIGH = {"10", "J", "Q", "K", "A"}
 LOW = {"2", "3", "4", "5", "6"}
@@ -12,6 +13,18 @@ NEUTRAL = {"7", "8", "9"}
 
 ALL_RANKS = HIGH | LOW | NEUTRAL
 
+def _build_hilo_table() -> bytes:
+    # bytes.translate table: last char of a rank -> Hi-Lo value as a signed byte
+    # (0x01 = +1, 0xFF = -1). "10" is keyed by its "0"; the "1" gets deleted.
+    table = bytearray(256)
+    for r in LOW:
+        table[ord(r[-1])] = 0x01
+    for r in HIGH:
+        table[ord(r[-1])] = 0xFF
+    return bytes(table)
+
+HILO_TABLE = _build_hilo_table()
+
 def normalize_token(tok: str) -> str:
     t = tok.strip().upper()
     if t in {"T"}:
@@ -25,24 +38,41 @@ def hilo_value(rank: str) -> int:
         return -1
     return 0
 
+def hilo_sum(cards: list[str]) -> int:
+    # One C-level translate pass over the whole batch instead of a
+    # hilo_value() call per card. Expects ranks already normalized.
+    buf = "".join(cards).encode("ascii").translate(HILO_TABLE, b"1")
+    # Two C-level counts; neutral cards (0x00) contribute nothing
+    return buf.count(0x01) - buf.count(0xFF)
+
+STATUS_LABELS = ("Dealer-favorable", "Neutral", "Player-favorable")
+
 def status_from_true_count(tc: float) -> str:
-    if tc > 1:
-        return "Player-favorable"
-    if tc < -1:
-        return "Dealer-favorable"
-    return "Neutral"
+    # (tc > 1) - (tc < -1) is -1/0/+1; shift it to index STATUS_LABELS
+    return STATUS_LABELS[(tc > 1) - (tc < -1) + 1]
 
-def parse_cards(line: str) -> list[str]:
+@lru_cache(maxsize=8)
+def decks_remaining_table(total_cards: int) -> tuple[float, ...]:
+    # Decks remaining indexed by cards seen, built once per shoe size
+    return tuple(max((total_cards - n) / 52.0, 0.0) for n in range(total_cards + 1))
+
+@lru_cache(maxsize=512)
+def _parse_line(line: str) -> tuple[str, ...]:
     # Accept space or comma separated inputs: "A K 10" or "A,K,10"
     raw = line.replace(",", " ").split()
-    cards: list[str] = []
-    for tok in raw:
-        r = normalize_token(tok)
-        if r not in ALL_RANKS:
-            raise ValueError(f"Carta inválida: '{tok}' (use 2-10, J, Q, K, A)")
-        cards.append(r)
+    cards = tuple(map(normalize_token, raw))
+    # Validate the whole batch in one set operation; only walk it on failure
+    if not ALL_RANKS.issuperset(cards):
+        for tok, r in zip(raw, cards):
+            if r not in ALL_RANKS:
+                raise ValueError(f"Carta inválida: '{tok}' (use 2-10, J, Q, K, A)")
     return cards
 
+def parse_cards(line: str) -> list[str]:
+    # Repeated identical batches are normalized and validated only once
+    # (invalid lines raise and are not cached)
+    return list(_parse_line(line))
+
 def prompt_decks() -> int:
     while True:
         s = input("Shoe decks (1-8): ").strip()
@@ -62,6 +92,28 @@ def print_help() -> None:
     print("  help      Mostra esta ajuda")
     print("  quit      Sai\n")
 
+@lru_cache(maxsize=32)
+def shoe_status(running_count: int, seen_cards: int, total_cards: int) -> tuple[int, float, float]:
+    # Keyed on the whole counting state, so repeated 'status' with no new
+    # cards is a cache hit and nothing needs invalidating on reset.
+    remaining_cards = max(total_cards - seen_cards, 0)
+    decks_remaining = decks_remaining_table(total_cards)[seen_cards]
+
+    # Avoid division by zero: if almost no cards remaining, treat as 0.25 deck
+    denom = max(decks_remaining, 0.25)
+    true_count = running_count / denom
+    return remaining_cards, decks_remaining, true_count
+
+def show_status(running_count: int, seen_cards: int, total_cards: int) -> None:
+    remaining_cards, decks_remaining, true_count = shoe_status(running_count, seen_cards, total_cards)
+
+    print(f"Running Count: {running_count}")
+    print(f"Cards Seen: {seen_cards}/{total_cards}")
+    print(f"Cards Remaining: {remaining_cards}")
+    print(f"Decks Remaining: {decks_remaining:.2f}")
+    print(f"True Count: {true_count:.2f}")
+    print(f"Status: {status_from_true_count(true_count)}")
+
 def main() -> None:
     print("Blackjack Hi-Lo Counter (CLI)")
     print("Hi-Lo: 2-6=+1, 7-9=0, 10-A=-1\n")
@@ -95,24 +147,8 @@ def main() -> None:
             print("Resetado. Running Count = 0, cartas vistas = 0.")
             continue
 
-        # compute + show status
-        def show_status() -> None:
-            remaining_cards = max(total_cards - seen_cards, 0)
-            decks_remaining = max(remaining_cards / 52.0, 0.0)
-
-            # Avoid division by zero: if almost no cards remaining, treat as 0.25 deck
-            denom = max(decks_remaining, 0.25)
-            true_count = running_count / denom
-
-            print(f"Running Count: {running_count}")
-            print(f"Cards Seen: {seen_cards}/{total_cards}")
-            print(f"Cards Remaining: {remaining_cards}")
-            print(f"Decks Remaining: {decks_remaining:.2f}")
-            print(f"True Count: {true_count:.2f}")
-            print(f"Status: {status_from_true_count(true_count)}")
-
         if cmd == "status":
-            show_status()
+            show_status(running_count, seen_cards, total_cards)
             continue
 
         # otherwise parse as cards
@@ -122,15 +158,16 @@ def main() -> None:
             print(e)
             continue
 
-        for r in cards:
-            # If shoe is "empty", prevent counting beyond total cards
-            if seen_cards >= total_cards:
-                print("Shoe acabou (já contou todas as cartas). Use 'reset' ou escolha mais decks.")
-                break
-            running_count += hilo_value(r)
-            seen_cards += 1
+        # If shoe is "empty", prevent counting beyond total cards
+        room = total_cards - seen_cards
+        if len(cards) > room:
+            print("Shoe acabou (já contou todas as cartas). Use 'reset' ou escolha mais decks.")
+            cards = cards[:room]
+
+        running_count += hilo_sum(cards)
+        seen_cards += len(cards)
 
-        show_status()
+        show_status(running_count, seen_cards, total_cards)
 
 if __name__ == "__main__":
     main()